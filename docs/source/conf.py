@@ -19,6 +19,10 @@ import warnings
 sys.path.insert(0, os.path.abspath('.'))
 sys.path.insert(0, os.path.abspath('../../src'))
 
+# let the framework know that the decorator documentation needs to be generated,
+# see ubii.framework.util.functools.document_decorator
+os.environ['SPHINX_DOC_BUILDING'] = '1'
+
 try:
     import importlib.metadata as importlib_metadata
 except ImportError:
@@ -75,9 +75,17 @@ import abc
 import asyncio
 import contextlib
 import dataclasses
+from dataclasses import fields as dataclass_fields, is_dataclass
 import logging
+import types
 import typing
 import warnings
+import weakref
+
+try:
+    from asyncio import timeout as async_timeout
+except ImportError:  # for Python<3.11
+    from async_timeout import timeout as async_timeout  # noqa
 
 import itertools
 import ubii.proto
@@ -105,6 +113,43 @@ T_Protocol = typing.TypeVar('T_Protocol', bound='AbstractClientProtocol')
 
 _data_kwargs = {'init': True, 'repr': True, 'eq': True}
 
+_behavior_proxies: typing.MutableMapping[typing.Type, typing.Type] = weakref.WeakValueDictionary()
+
+
+def _notifying_proxy(behavior: typing.Type) -> typing.Type:
+    """
+    Return a subclass of ``behavior`` whose instances notify the :class:`UbiiClient` bound to their
+    ``_client`` attribute (if any) of attribute assignments.
+
+    The proxy classes are created once per behavior type and shared between clients -- a new class per
+    client would needlessly pollute the method cache, since the only per-client state is the client
+    reference carried by the instances.
+    """
+    proxy = _behavior_proxies.get(behavior)
+    if proxy is not None:
+        return proxy
+
+    class _(behavior):  # type: ignore
+        """
+        Proxy to notify client of changed fields.
+        """
+
+        def __setattr__(self, key, value):
+            super().__setattr__(key, value)
+            client = getattr(self, '_client', None)
+            if client is not None:
+                client.notify()
+
+    # keep the naming of the original behavior, so the generated dataclass __repr__ stays readable
+    _.__name__ = behavior.__name__
+    _.__qualname__ = behavior.__qualname__
+    _.__module__ = behavior.__module__
+
+    from .util.functools import append_doc
+    append_doc(_)(behavior.__doc__)
+    _behavior_proxies[behavior] = _
+    return _
+
 BehaviorDict = typing.TypedDict(
     'BehaviorDict',
     {'required_behaviors': typing.Tuple[typing.Type, ...], 'optional_behaviors': typing.Tuple[typing.Type, ...]}
@@ -158,12 +203,18 @@ class unsubscribe_call(Protocol):
 
 
 class publish_call(Protocol):
-    def __call__(self, *records: ubii.proto.TopicDataRecord | typing.Dict) -> typing.Awaitable[None]:
+    def __call__(
+            self, *records: ubii.proto.TopicDataRecord | ubii.proto.TopicData | typing.Dict
+    ) -> typing.Awaitable[None]:
         """
         publish_call objects need to have this call signature
 
         Args:
-            *records: :class:`~ubii.proto.TopicDataRecord` messages or compatible dictionaries
+            *records: :class:`~ubii.proto.TopicDataRecord` messages or compatible dictionaries.
+                A single prebuilt :class:`~ubii.proto.TopicData` message is sent as is -- records
+                passed individually need to be copied into a fresh :class:`~ubii.proto.TopicData`
+                message first, so for large payloads (e.g. image data) building the
+                :class:`~ubii.proto.TopicData` once in the producer avoids that copy
 
         Returns:
             some awaitable performing the `master node` communication
@@ -382,6 +433,33 @@ class DiscoverProcessingModules:
     """
 
 
+class _versioned_predicate(util.awaitable_predicate):
+    """
+    Like :class:`~codestare.async_utils.awaitable_predicate` but waiters are woken through the
+    client's internal versioned event instead of the :attr:`~UbiiClient.change_specs` condition --
+    setting one event wakes every waiter at once, where the condition would make each waiter
+    reacquire the lock and be notified individually (and would require a notifier task to do so
+    from non-async code, see :meth:`UbiiClient.notify`)
+    """
+
+    def __init__(self, predicate: typing.Callable[[], bool], client: UbiiClient, timeout=None):
+        super().__init__(predicate=predicate, condition=client._change_specs, timeout=timeout)
+        self.client = client
+
+    async def _waiter(self):
+        client = self.client
+        while not self.predicate():
+            version = client._specs_version
+            await client._specs_event.wait()
+            if client._specs_version == version:
+                # woken for a change seen earlier -- yield once so the scheduled clear of the
+                # event can run before waiting again
+                await asyncio.sleep(0)
+
+
+# note for future optimization attempts: neither UbiiClient nor AbstractClientProtocol can
+# profit from __slots__ -- proto.Message and the codestare Registry / wrapper bases are
+# dict-based, so slotted leaf classes would still carry a full instance __dict__
 @util.dunder.repr('id')
 class UbiiClient(ubii.proto.Client,
                  typing.Awaitable['UbiiClient'],
@@ -502,6 +580,12 @@ class UbiiClient(ubii.proto.Client,
     :attr:`.implements`
     """
 
+    max_inflight = 256
+    """
+    Bound for the number of concurrently running tasks spawned on behalf of this client by its
+    protocol (e.g. publish fanout) -- enforced through :attr:`.inflight`
+    """
+
     @util.dunder.repr('client')
     class ClientInitTaskWrapper(typing.Awaitable['UbiiClient']):
         """
@@ -533,9 +617,13 @@ class UbiiClient(ubii.proto.Client,
                     f"{self.client.protocol.state.value!r} instead."
                 )
 
+            # bypass the notifying proxy while clearing the fields, one notification
+            # at the end is enough
             for behavior in self.client._behaviors:
-                for field in dataclasses.fields(behavior):
-                    setattr(self.client[behavior], field.name, None)
+                for name in self.client._behavior_field_names[behavior]:
+                    object.__setattr__(self.client[behavior], name, None)
+
+            self.client.notify()
 
             self._set_task()
 
@@ -588,8 +676,12 @@ class UbiiClient(ubii.proto.Client,
         behaviors = list(
             itertools.chain(self._required_behaviors, self._optional_behaviors)
         )
+        self._all_behaviors_set = frozenset(behaviors)
+        self._behaviors_dict: BehaviorDict = {
+            'optional_behaviors': self._optional_behaviors, 'required_behaviors': self._required_behaviors
+        }
 
-        if not all(dataclasses.is_dataclass(b) for b in behaviors):
+        if not all(is_dataclass(b) for b in behaviors):
             raise ValueError(f"Only dataclasses can be passed as behaviors")
 
         if not self.name:
@@ -599,13 +691,24 @@ class UbiiClient(ubii.proto.Client,
             self.state = self.State.UNAVAILABLE
 
         self._change_specs = asyncio.Condition()
+        self._specs_version = 0
+        self._specs_event = asyncio.Event()
         self._notifier = None
+        self._inflight = asyncio.Semaphore(type(self).max_inflight)
         self._protocol = protocol
         self._behaviors = {kls: self._patch_behavior(kls)() for kls in behaviors}
+        self._behavior_field_names: typing.Dict[typing.Type, typing.Tuple[str, ...]] = {
+            kls: tuple(field.name for field in dataclass_fields(kls)) for kls in behaviors
+        }
 
-        self._ctx: typing.AsyncContextManager = self._with_running_protocol()
+        # created lazily in :meth:`.__aenter__` -- most short lived clients never use the
+        # async context manager interface
+        self._ctx: typing.AsyncContextManager | None = None
         self._init = self.ClientInitTaskWrapper(self)
-        self._init_specs: typing.Dict = type(self).to_dict(self)
+        # serializing is a cheap C-level call, the dict snapshot is materialized lazily in
+        # :attr:`.initial_specs` -- most clients are never reset
+        self._init_serialized: bytes = type(self).serialize(self)
+        self._init_specs: typing.Dict | None = None
 
     @property
     def initial_specs(self) -> dict:
@@ -618,44 +721,52 @@ class UbiiClient(ubii.proto.Client,
         explicitly assigning to values of this dictionary, otherwise it contains the specifications
         that were used when the object was initialized.
         """
+        if self._init_specs is None:
+            self._init_specs = type(self).to_dict(type(self).deserialize(self._init_serialized))
+
         return self._init_specs
 
     def _patch_behavior(self, behavior: typing.Type):
         """
         Setting attributes of the behavior should notify the tasks waiting for changed specs of this client,
         e.g. the tasks waiting for implementation state.
-        """
-        client = self
 
-        # see if (https://github.com/python/mypy/issues/5865) is resolved to check if mypy gets this
-        class _(behavior):  # type: ignore
-            """
-            Proxy to notify client of changed fields.
-            """
-
-            def __setattr__(self, key, value):
-                super().__setattr__(key, value)
-                client.notify()
+        Returns a factory creating instances of the shared proxy class for ``behavior``
+        (see :func:`_notifying_proxy`) bound to this client.
+        """
+        proxy = _notifying_proxy(behavior)
 
-            def __repr__(self):
-                fields = dataclasses.fields(self)
-                return (f"{behavior.__module__}.{behavior.__name__}"
-                        f"({', '.join('{}={!r}'.format(f.name, getattr(self, f.name)) for f in fields)})")
+        def factory(*args, **kwargs):
+            instance = proxy(*args, **kwargs)
+            object.__setattr__(instance, '_client', self)
+            return instance
 
-        from .util.functools import append_doc
-        append_doc(_)(behavior.__doc__)
-        return _
+        return factory
 
     def notify(self) -> None:
         """
         Creates a task to notify all coroutines waiting for :attr:`.change_specs` (allows easy notification
         from outside a coroutine i.e. a non-async callback, where it's impossible to acquire the :attr:`.change_specs`
-        lock asynchronously)
+        lock asynchronously).
+
+        Waiters created by :meth:`.implements` are woken through an internal versioned event --
+        incrementing the version and setting the event is all that happens on their account, no
+        task is created. The notifier task is only scheduled for coroutines waiting directly on
+        the :attr:`.change_specs` condition; if there are none this is a no-op -- waiters always
+        evaluate their predicate before waiting, so they can't miss a change that happened earlier.
         """
         assert self.protocol
         assert self._change_specs
         assert hasattr(self, '_notifier')
 
+        self._specs_version += 1
+        if not self._specs_event.is_set():
+            self._specs_event.set()
+            self.task_nursery.loop.call_soon(self._specs_event.clear)
+
+        if not self._change_specs._waiters:  # noqa -- private but stable, no coroutine is waiting
+            return
+
         async def _notify():
             async with self._change_specs:
                 self._change_specs.notify_all()
@@ -664,6 +775,21 @@ class UbiiClient(ubii.proto.Client,
         if not self._notifier:
             self._notifier = self.task_nursery.create_task(_notify())
 
+    @property
+    def inflight(self) -> asyncio.Semaphore:
+        """
+        Semaphore bounding concurrent per-record work for this client (see :attr:`.max_inflight`).
+
+        Acquire `before` spawning a task and release when the task is done -- acquiring inside the
+        task would queue up all tasks first and defeat the backpressure ::
+
+            await client.inflight.acquire()
+            task = client.task_nursery.create_task(coro())
+            task.add_done_callback(lambda _: client.inflight.release())
+
+        """
+        return self._inflight
+
     @property
     def task_nursery(self) -> util.TaskNursery:
         """
@@ -737,11 +863,14 @@ class UbiiClient(ubii.proto.Client,
             and / or can be used in an :ref:`await` to wait until that is the case
         """
 
+        # behavior instances and field names don't change, resolve them once instead of
+        # re-indexing the mappings on every predicate evaluation
+        checked = [(self._behaviors[b], self._behavior_field_names[b]) for b in behaviors]
+
         def fields_not_none():
-            return all(getattr(self._behaviors[b], field.name) is not None
-                       for b in behaviors for field in dataclasses.fields(b))
+            return all(getattr(instance, name) is not None for instance, names in checked for name in names)
 
-        return util.awaitable_predicate(predicate=fields_not_none, condition=self._change_specs, timeout=timeout)
+        return _versioned_predicate(predicate=fields_not_none, client=self, timeout=timeout)
 
     @property
     def behaviors(self) -> BehaviorDict:
@@ -749,7 +878,7 @@ class UbiiClient(ubii.proto.Client,
         Return mapping :math:`(optional / required) \\rightarrow dataclass` showing which behaviors are defined as
         optional or required by this client. You can check their implementation status using :func:`.implements`.
         """
-        return {'optional_behaviors': self._optional_behaviors, 'required_behaviors': self._required_behaviors}
+        return self._behaviors_dict
 
     def wants(self, *behaviors) -> bool:
         """
@@ -767,10 +896,8 @@ class UbiiClient(ubii.proto.Client,
         Returns:
             True if all behaviors are contained in required or optional behaviors
         """
-        return all(
-            behavior in self.behaviors['required_behaviors'] or behavior in self.behaviors['optional_behaviors']
-            for behavior in behaviors
-        )
+        # set containment instead of scanning the behavior tuples for each argument
+        return self._all_behaviors_set.issuperset(behaviors)
 
     @contextlib.asynccontextmanager
     async def _with_running_protocol(self):
@@ -792,10 +919,15 @@ class UbiiClient(ubii.proto.Client,
         return self._init.__await__()
 
     def __aenter__(self):
+        if self._ctx is not None:
+            raise RuntimeError(f"{self} is already used as a context manager")
+
+        self._ctx = self._with_running_protocol()
         return self._ctx.__aenter__()
 
     def __aexit__(self, *exc_info):
-        return self._ctx.__aexit__(*exc_info)
+        ctx, self._ctx = self._ctx, None
+        return ctx.__aexit__(*exc_info)
 
     async def reset(self):
         """
@@ -808,8 +940,9 @@ class UbiiClient(ubii.proto.Client,
         """
         old_id = self.id
         if hasattr(self.task_nursery, 'sentinel_task') and not self.task_nursery.sentinel_task:
-            log.debug(f"{self}'s task nursery needs seems to be dead."
-                      f" Creating new task nursery for {self}.")
+            # lazy %-formatting -- don't stringify the client when debug logging is off
+            log.debug("%s's task nursery needs seems to be dead."
+                      " Creating new task nursery for %s.", self, self)
 
             stack = self.task_nursery.pop_all()
             self.protocol.task_nursery = type(self.task_nursery)(
@@ -828,13 +961,16 @@ class UbiiClient(ubii.proto.Client,
             warning = (f"{type(self.protocol)} does not seem to support resetting the protocol state."
                        f" It does not define a state change from its end state to None!")
 
-        for name, value in self._init_specs.items():
-            setattr(self, name, value)
+        # the items can't be snapshotted at construction time: :attr:`.initial_specs` is documented
+        # as adaptable during the client's lifetime, so iterate the live dict with a local setattr
+        set_spec = setattr
+        for name, value in self.initial_specs.items():
+            set_spec(self, name, value)
 
         if warning:
             warnings.warn(warning)
         else:
-            log.debug(f"{self} (with old id {old_id!r}) was reset successfully and can be used again.")
+            log.debug("%s (with old id %r) was reset successfully and can be used again.", self, old_id)
 
     @property
     def protocol(self: UbiiClient[T_Protocol]) -> T_Protocol:
@@ -844,14 +980,19 @@ class UbiiClient(ubii.proto.Client,
         return self._protocol
 
     def __getitem__(self, behavior: typing.Type[T]) -> T:
+        # single probe into a plain dict keyed by the behavior classes -- type objects hash by
+        # identity, so an id()-indexed mirror would not beat this
         return self._behaviors[behavior]
 
     def __setitem__(self, key, value):
-        if not dataclasses.is_dataclass(value):
+        if not is_dataclass(value):
             raise ValueError(f"can only assign dataclass instances to {key}, got {type(value)}")
 
-        # create copy of value that is a proxy object
-        self._behaviors[key] = self._patch_behavior(type(value))(**dataclasses.asdict(value))  # type: ignore
+        # create copy of value that is a proxy object -- shallow field extraction instead of
+        # dataclasses.asdict, which deep-copies the whole object graph and would clone
+        # loop-bound objects like tasks or proto messages carried by behavior fields
+        field_values = {f.name: getattr(value, f.name) for f in dataclass_fields(value)}
+        self._behaviors[key] = self._patch_behavior(type(value))(**field_values)  # type: ignore
         self.notify()
 
 
@@ -872,18 +1013,34 @@ class AbstractClientProtocol(protocol.AbstractProtocol[T_EnumFlag], util.Registr
     """
     __hook_decorators__: typing.Set[Decorator] = set()
 
+    _registry_key_cache = None
+    """
+    Memoized :attr:`.__registry_key__` -- class level default since the registry machinery reads the
+    key during ``__new__``, before ``__init__`` could assign an instance attribute
+    """
+
     @property
     def __registry_key__(self):
         """
         A Standard Protocol can ba associated with _one_ client, so if we have a registered client with
         unique id, we use this id as the key for the registry view.
         During initialisation of the client the key is the default value (~ __module__.__qualname__.#id)
+
+        The key is memoized once a client `id` is available -- it only changes when a client is attached
+        or (re)registered, which invalidates :attr:`._registry_key_cache`
         """
-        default = type(self).__default_key_value__
-        if not hasattr(self.context, 'client') or not self.context.client or not self.context.client.id:
-            return default
+        if self._registry_key_cache is not None:
+            return self._registry_key_cache
+
+        # plain getattr walk -- hasattr would raise and swallow an AttributeError on
+        # every access before a client is attached
+        client = getattr(self.context, 'client', None)
+        client_id = client.id if client is not None else None
+        if not client_id:
+            return type(self).__default_key_value__
 
-        return self.context.client.id
+        self._registry_key_cache = client_id
+        return client_id
 
     def __init__(self, config: constants.UbiiConfig = constants.GLOBAL_CONFIG, log: logging.Logger | None = None):
         self.log = log or logging.getLogger(__name__)
@@ -894,14 +1051,14 @@ class AbstractClientProtocol(protocol.AbstractProtocol[T_EnumFlag], util.Registr
         super().__init__()
 
     @abc.abstractmethod
-    async def create_service_map(self, context):
+    async def create_service_map(self, context: types.SimpleNamespace) -> None:
         """
         Create a :class:`~ubii.framework.services.ServiceMap` in the context as
         ``context.service_map`` which has to be able to make a single service call ``context.service_map.server_config``
         """
 
     @abc.abstractmethod
-    async def update_config(self, context):
+    async def update_config(self, context: types.SimpleNamespace) -> None:
         """
         Update the server configuration in the context. After completion of this coroutine
 
@@ -911,7 +1068,7 @@ class AbstractClientProtocol(protocol.AbstractProtocol[T_EnumFlag], util.Registr
         """
 
     @abc.abstractmethod
-    async def update_services(self, context):
+    async def update_services(self, context: types.SimpleNamespace) -> None:
         """
         Update the service map in the context.
 
@@ -920,7 +1077,7 @@ class AbstractClientProtocol(protocol.AbstractProtocol[T_EnumFlag], util.Registr
         """
 
     @abc.abstractmethod
-    async def create_client(self, context):
+    async def create_client(self, context: types.SimpleNamespace) -> None:
         """
         Create a client in the context.
 
@@ -939,7 +1096,7 @@ class AbstractClientProtocol(protocol.AbstractProtocol[T_EnumFlag], util.Registr
         """
 
     @abc.abstractmethod
-    async def create_topic_connection(self, context):
+    async def create_topic_connection(self, context: types.SimpleNamespace) -> None:
         """
         Should create a :class:`ubii.framework.topics.DataConnection`.
 
@@ -948,7 +1105,7 @@ class AbstractClientProtocol(protocol.AbstractProtocol[T_EnumFlag], util.Registr
         """
 
     @abc.abstractmethod
-    async def implement_client(self, context):
+    async def implement_client(self, context: types.SimpleNamespace) -> None:
         """
         Make sure the ``context.client`` has fully implemented behavior. The context at this point should contain
         a `context.service_map` and a `context.topic_connection`.
@@ -958,7 +1115,7 @@ class AbstractClientProtocol(protocol.AbstractProtocol[T_EnumFlag], util.Registr
 
     @hook_function
     @document_decorator('.hook_function')
-    async def on_start(self, context: typing.Any) -> None:
+    async def on_start(self, context: types.SimpleNamespace) -> None:
         """
         Awaits (in order):
             - :meth:`create_service_map`
@@ -983,7 +1140,7 @@ class AbstractClientProtocol(protocol.AbstractProtocol[T_EnumFlag], util.Registr
 
     @hook_function
     @document_decorator('.hook_function')
-    async def on_create(self, context) -> None:
+    async def on_create(self, context: types.SimpleNamespace) -> None:
         """
         Enters the async context manager created by :meth:`register_client` in the :attr:`task_nursery` i.e.
         registers the client and prepares to unregister it if the protocol should be stopped
@@ -1001,7 +1158,7 @@ class AbstractClientProtocol(protocol.AbstractProtocol[T_EnumFlag], util.Registr
 
     @hook_function
     @document_decorator('.hook_function')
-    async def on_registration(self, context) -> None:
+    async def on_registration(self, context: types.SimpleNamespace) -> None:
         """
         Awaits (in order):
             - :meth:`create_topic_connection`
@@ -1025,8 +1182,10 @@ class AbstractClientProtocol(protocol.AbstractProtocol[T_EnumFlag], util.Registr
         await self.create_topic_connection(context)
         await self.implement_client(context)
         try:
-            # make sure client is implemented
-            context.client = await asyncio.wait_for(context.client, timeout=5)
+            # make sure client is implemented -- the timeout context only arms a timer callback
+            # instead of wrapping the awaitable in an extra task like asyncio.wait_for
+            async with async_timeout(5):
+                context.client = await context.client
         except asyncio.TimeoutError as e:
             raise RuntimeError(f"Client is not implemented") from e
 
@@ -1034,7 +1193,7 @@ class AbstractClientProtocol(protocol.AbstractProtocol[T_EnumFlag], util.Registr
 
     @hook_function
     @document_decorator('.hook_function')
-    async def on_connect(self, context) -> None:
+    async def on_connect(self, context: types.SimpleNamespace) -> None:
         """
         Starts a :class:`ubii.framework.topics.StreamSplitRoutine` in the :attr:`task_nursery` to split
         :class:`ùbii.proto.TopicData` messages from the ``context.topic_connection`` to the topics of the
@@ -1053,7 +1212,7 @@ class AbstractClientProtocol(protocol.AbstractProtocol[T_EnumFlag], util.Registr
 
     @hook_function
     @document_decorator('.hook_function')
-    async def on_stop(self, context) -> None:
+    async def on_stop(self, context: types.SimpleNamespace) -> None:
         """
         Sets the :attr:`~UbiiClient.state` of the :attr:`client` to :attr:`~UbiiClient.State.UNAVAILABLE`
 
@@ -1073,8 +1232,10 @@ class AbstractClientProtocol(protocol.AbstractProtocol[T_EnumFlag], util.Registr
         Register decorators for hook functions
         """
         hook_function: util.hook
-        for hook_function, hk in itertools.product(cls.hook_function.registry.values(), cls.__hook_decorators__):
-            if hk not in hook_function.decorators():
+        for hook_function in cls.hook_function.registry.values():
+            # set difference instead of a cartesian product with per-pair list scans
+            # registration recomposes the decorator stack eagerly, calls never pay for it
+            for hk in cls.__hook_decorators__ - hook_function.decorator_set():
                 hook_function.register_decorator(hk)
 
         super().__init_subclass__()
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import argparse
-import collections
+import dataclasses
 import functools
 import importlib.resources
 import logging.config
@@ -20,7 +19,26 @@ __config__ = yaml.safe_load(importlib.resources.read_text(util, 'logging_config.
 
 
 class _logging_setup:
-    log_config = collections.namedtuple('log_config', ['config', 'level', 'warning_filter'])
+    @dataclasses.dataclass(frozen=True)
+    class log_config:
+        """
+        One entry of the config stack -- frozen, entries are shared freely
+        (e.g. :attr:`effective_config` hands out the top of the stack directly)
+        """
+        config: Dict
+        level: int
+        warning_filter: str
+
+    _warnings_captured = False
+    """
+    class level flag -- capturing warnings installs a handler and rewires
+    :func:`warnings.showwarning` globally, doing it once is enough
+    """
+    _last_warning_filter = None
+    """
+    class level memo of the filter last passed to :func:`warnings.simplefilter`, the
+    warning machinery is process global state anyway
+    """
 
     @staticmethod
     def add_log_level(name: str, value: int):
@@ -59,10 +77,11 @@ class _logging_setup:
         self.base_config = self.log_config(config=base_config, warning_filter=warning_filter, level=log_level)
         self._configs: List[_logging_setup.log_config] = [self.base_config]
         self._applied = False
+        self._last_applied_config: Dict | None = None
 
     @property
     def effective_config(self):
-        return self.log_config(**self._configs[-1]._asdict())
+        return self._configs[-1]
 
     def change(self, config: Dict | None = None, verbosity: int | None = None):
         if config is None and verbosity is None:
@@ -79,6 +98,11 @@ class _logging_setup:
         config = config or self.effective_config.config
         config['version'] = 1  # other versions are not supported by the logging framework
 
+        if config == self.effective_config.config:
+            # reuse the currently applied dict, so _apply recognizes it by identity
+            # and skips the dictConfig round
+            config = self.effective_config.config
+
         new_config = self.log_config(level=verbosity,
                                      config=config,
                                      warning_filter=self.effective_config.warning_filter)
@@ -92,18 +116,33 @@ class _logging_setup:
 
     def _apply(self):
         self._applied = True
+        effective = self.effective_config
 
-        logging.config.dictConfig(self.effective_config.config)
-        logging.captureWarnings(True)
-        logging.getLogger().setLevel(level=self.effective_config.level)
+        if effective.config is not self._last_applied_config:
+            logging.config.dictConfig(effective.config)
+            self._last_applied_config = effective.config
 
-        if not sys.warnoptions:
-            import os, warnings
-            warnings.simplefilter(self.effective_config.warning_filter)  # Change the filter in this process
-            os.environ["PYTHONWARNINGS"] = self.effective_config.warning_filter  # Also affect subprocesses
+        if not type(self)._warnings_captured:
+            logging.captureWarnings(True)
+            type(self)._warnings_captured = True
+
+        root = logging.getLogger()
+        if root.level != effective.level:
+            # setLevel clears the logger cache of every logger, don't do it for nothing
+            root.setLevel(level=effective.level)
+
+        if not sys.warnoptions and effective.warning_filter != type(self)._last_warning_filter:
+            import os
+            warnings.simplefilter(effective.warning_filter)  # Change the filter in this process
+            os.environ["PYTHONWARNINGS"] = effective.warning_filter  # Also affect subprocesses
+            type(self)._last_warning_filter = effective.warning_filter
 
     def reset(self):
-        self._configs[:] = [self._configs[0]]
+        if len(self._configs) == 1 and self._applied:
+            # already at the applied base config, nothing to do
+            return
+
+        del self._configs[1:]
         self._apply()
 
     def __enter__(self):
@@ -127,6 +166,16 @@ logging_setup = _logging_setup(base_config=__config__, log_level=logging.INFO, w
 """
 
 
+@functools.lru_cache(maxsize=32)
+def _load_yaml(path: str) -> Dict:
+    """
+    Read and parse a `yaml` file, caching the result by path so repeated invocations
+    (e.g. tests parsing the same command line over and over) don't re-read and re-scan the file
+    """
+    with open(path) as conf:
+        return yaml.safe_load(conf)
+
+
 def parse_args(parser: argparse.ArgumentParser | None = None) -> argparse.Namespace:
     """
     Convenience function to parse command line arguments.
@@ -156,6 +205,9 @@ def parse_args(parser: argparse.ArgumentParser | None = None) -> argparse.Namesp
     Returns:
         parsed arguments
     """
+    # only needed for command line entry points, don't make every framework import pay
+    # for the argparse machinery
+    import argparse
     parser = parser or argparse.ArgumentParser()
 
     parser.add_argument('--verbose', '-v', action='count', default=0)
@@ -170,8 +222,9 @@ def parse_args(parser: argparse.ArgumentParser | None = None) -> argparse.Namesp
         verbosity = min(logging.DEBUG, verbosity)
 
     if args.log_config:
-        with open(args.log_config) as conf:
-            args.log_config = yaml.safe_load(conf)
+        # shallow copy, so callers mutating top level keys (like change() setting
+        # 'version') don't taint the cached dict
+        args.log_config = dict(_load_yaml(args.log_config))
     else:
         args.log_config = __config__
 
@@ -453,7 +453,7 @@ class ProcessingRoutine(ubii.proto.ProcessingModule, metaclass=util.ProtoRegistr
         self.validate()
 
         # eval stringified
-        if eval_strings or util.debug() and self.language == self.Language.PY:
+        if eval_strings or util.__DEBUG__ and self.language == self.Language.PY:
             self._eval_string_funcs()
 
         self._local_output_topics = topics.TopicStore(
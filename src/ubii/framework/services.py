@@ -17,7 +17,6 @@ from typing import (
 import ubii.proto
 from . import (
     util,
-    debug,
 )
 from .util.typing import Protocol
 
@@ -446,7 +445,7 @@ class DefaultServiceMap(ServiceMap[T_Service]):
             return super().__getattr__(item)
         except AttributeError as e:
             # we want to give some additonal info because maybe it's just a typo
-            if debug():
+            if util.__DEBUG__:
                 info = self._get_debug_info(missing_attr=item)
                 raise AttributeError(info) from e
             else:
@@ -36,6 +36,7 @@ from __future__ import annotations
 import abc
 import asyncio
 import contextlib
+import fnmatch
 import functools
 import logging
 import re
@@ -405,6 +406,129 @@ class BasicTopic(Topic[ubii.proto.TopicDataRecord, int]):
 Topic_co = typing.TypeVar('Topic_co', bound=Topic, covariant=True)
 
 
+class TopicTrie:
+    """
+    Index for topic glob patterns, used to dispatch incoming topic names to matching patterns without
+    scanning every pattern.
+
+    Patterns are decomposed into their ``/``-separated segments and stored in a prefix tree.
+    The tree indexes two kinds of patterns directly:
+
+        *   patterns without any glob characters (simple topic names) -- matched by walking the tree
+        *   patterns ending in a ``/*`` (or just ``*``) whose remaining segments are literal --
+            the trailing ``*`` matches any remainder of the topic name, like :mod:`fnmatch` would
+
+    All other patterns (e.g. with wildcards in the middle, or character classes) fall back to a linear
+    :func:`fnmatch.fnmatch` scan, so matching semantics are exactly those of
+    :meth:`~ubii.framework.util.MatchMappingMixin.match_name` -- only the cost for the common pattern
+    shapes drops from :math:`O(N_{patterns})` to :math:`O(depth)`.
+
+    Example:
+
+        >>> trie = TopicTrie()
+        >>> for pattern in ['/info/processing_module/start', '/info/*', '*']:
+        ...     trie.insert(pattern)
+        >>> sorted(trie.match('/info/processing_module/start'))
+        ['*', '/info/*', '/info/processing_module/start']
+        >>> sorted(trie.match('/sessions/start'))
+        ['*']
+    """
+
+    _glob_chars = frozenset('*?[')
+
+    class node:
+        """
+        A single tree node for one pattern segment
+        """
+        __slots__ = ('children', 'terminals', 'star_terminals')
+
+        def __init__(self):
+            self.children: typing.Dict[str, TopicTrie.node] = {}
+            self.terminals: typing.Set[str] = set()
+            self.star_terminals: typing.Set[str] = set()
+
+    def __init__(self):
+        self._root = self.node()
+        self._fallback: typing.Set[str] = set()
+
+    def _tree_segments(self, pattern: str) -> typing.Tuple[typing.List[str], bool] | None:
+        """
+        Compute the literal segments for patterns that can be indexed in the tree, i.e.
+        returns ``(segments, trailing_star)`` or :obj:`None` if the pattern needs fallback matching
+        """
+        segments = pattern.split('/')
+        trailing_star = segments[-1] == '*'
+        if trailing_star:
+            segments = segments[:-1]
+
+        if any(self._glob_chars.intersection(segment) for segment in segments):
+            return None
+
+        return segments, trailing_star
+
+    def insert(self, pattern: str) -> None:
+        """
+        Add a pattern to the index
+        """
+        decomposed = self._tree_segments(pattern)
+        if decomposed is None:
+            self._fallback.add(pattern)
+            return
+
+        segments, trailing_star = decomposed
+        node = self._root
+        for segment in segments:
+            node = node.children.setdefault(segment, self.node())
+
+        (node.star_terminals if trailing_star else node.terminals).add(pattern)
+
+    def remove(self, pattern: str) -> None:
+        """
+        Remove a pattern from the index, pruning now empty nodes
+        """
+        decomposed = self._tree_segments(pattern)
+        if decomposed is None:
+            self._fallback.discard(pattern)
+            return
+
+        segments, trailing_star = decomposed
+        path = [self._root]
+        for segment in segments:
+            node = path[-1].children.get(segment)
+            if node is None:
+                return
+
+            path.append(node)
+
+        (path[-1].star_terminals if trailing_star else path[-1].terminals).discard(pattern)
+
+        for segment, (parent, node) in zip(reversed(segments), zip(reversed(path[:-1]), reversed(path[1:]))):
+            if node.children or node.terminals or node.star_terminals:
+                break
+
+            del parent.children[segment]
+
+    def match(self, name: str) -> typing.Tuple[str, ...]:
+        """
+        Returns all stored patterns that ``name`` matches (in the :func:`fnmatch.fnmatch` sense)
+        """
+        matches = []
+        node = self._root
+        for segment in name.split('/'):
+            # a trailing ``*`` matches the remaining segments, including this one
+            matches.extend(node.star_terminals)
+            node = node.children.get(segment)
+            if node is None:
+                break
+        else:
+            matches.extend(node.terminals)
+
+        if self._fallback:
+            matches.extend(pattern for pattern in self._fallback if fnmatch.fnmatch(name=name, pat=pattern))
+
+        return tuple(matches)
+
+
 class TopicStore(util.MatchMappingMixin, util.DefaultHookMap[str, Topic_co], typing.Generic[Topic_co]):
     """
     A TopicStore acts like a :class:`~collections.defaultdict` mapping of :math:`pattern \\rightarrow Topic`,
@@ -422,8 +546,37 @@ class TopicStore(util.MatchMappingMixin, util.DefaultHookMap[str, Topic_co], typ
         >>> store.default_factory('topic/glob/pattern_two')
         >>> [topic.pattern for topic in store.match_pattern('topic*')]
         ['topic/glob/pattern_one', 'topic/glob/pattern_two'])
+
+    See Also:
+        :class:`TopicTrie` -- pattern index used to speed up :meth:`.match_name` lookups
     """
 
+    def __init__(self, base_factory: typing.Callable[[str], Topic_co]):
+        super().__init__(base_factory)
+        self._pattern_trie = TopicTrie()
+
+    @util.hook
+    @util.document_decorator(util.hook)
+    def default_factory(self, key: str) -> None:
+        """
+        Like :meth:`~ubii.framework.util.DefaultHookMap.default_factory` but also adds the new
+        pattern to the :class:`TopicTrie` index
+        """
+        self.data[key] = self.base_factory(key)
+        self._pattern_trie.insert(key)
+
+    def __delitem__(self, key: str):
+        super().__delitem__(key)
+        self._pattern_trie.remove(key)
+
+    def match_name(self, name) -> typing.Tuple[Topic_co, ...]:
+        """
+        Like :meth:`~ubii.framework.util.MatchMappingMixin.match_name` but looks up matching patterns in
+        the :class:`TopicTrie` index instead of scanning every contained pattern -- this runs for every
+        received :class:`~ubii.proto.TopicDataRecord`, see :meth:`StreamSplitRoutine.split_to_topics`
+        """
+        return tuple(self.data[pattern] for pattern in self._pattern_trie.match(name))
+
     class on_create_register_callback:
         """
         This decorator can simply be applied once, if you later want to add additional callbacks
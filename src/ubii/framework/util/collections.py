@@ -16,7 +16,14 @@ def merge_dicts(base: typing.Dict, merge: typing.Dict, op: typing.Callable = add
         else:
             return op(left, right)
 
-    return {**base, **merge, **{k: merge_op(base[k], merge[k]) for k in base if k in merge}}
+    # dict views support set operations -- incremental updates (e.g. logging configs
+    # touching a single handler) usually collide on few keys, so recurse only into
+    # those instead of probing every base key
+    common = base.keys() & merge.keys()
+    if not common:
+        return {**base, **merge}
+
+    return {**base, **merge, **{k: merge_op(base[k], merge[k]) for k in common}}
 
 
 class MatchMappingMixin(typing.Mapping[str, T_co], abc.ABC):
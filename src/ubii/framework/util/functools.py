@@ -5,6 +5,7 @@ import difflib
 import functools
 import inspect
 import logging
+import os
 import pickle
 import re
 import types
@@ -20,6 +21,11 @@ import ubii.proto as ub
 from . import RegistryMeta
 from .typing import S, T, ExcInfo
 
+try:
+    from rapidfuzz import fuzz as _rapidfuzz_fuzz, process as _rapidfuzz_process
+except ImportError:  # optional dependency, difflib is used instead
+    _rapidfuzz_fuzz = _rapidfuzz_process = None
+
 
 # helper function, equivalent to functools._unwrap_partial
 def _unwrap_partial(func):
@@ -55,15 +61,50 @@ def similar(choices: typing.Sequence, item: typing.Any, cutoff=0.70):
         elements from ``choices`` with :math:`similarity(choice, item) > cutoff`
 
     See Also:
-        :class:`difflib.SequenceMatcher` -- used internally to compute similarity score
+        :class:`difflib.SequenceMatcher` -- used internally to compute similarity score when
+        the optional `rapidfuzz` package is not installed
     """
-    _similarity = lambda k: difflib.SequenceMatcher(None, k, item).ratio()  # noqa
-    return list(sorted(filter(lambda item: _similarity(item) > cutoff, choices), key=_similarity, reverse=True))
+    if _rapidfuzz_process is not None:
+        # rapidfuzz scores on a 0-100 scale and treats its cutoff as inclusive,
+        # filter again to keep the strict > semantics of the difflib path
+        matches = _rapidfuzz_process.extract(
+            item, choices, scorer=_rapidfuzz_fuzz.ratio, score_cutoff=cutoff * 100, limit=None
+        )
+        return [choice for choice, score, _ in matches if score > cutoff * 100]
+
+    # one matcher for all candidates -- set_seq2 caches the index for ``item``, set_seq1 is cheap
+    matcher = difflib.SequenceMatcher(None)
+    matcher.set_seq2(item)
+
+    scored = []
+    for k in choices:
+        if k == item:
+            scored.append((1.0, k))
+            continue
+
+        matcher.set_seq1(k)
+        # cheap upper bounds first, the actual ratio computation is quadratic
+        if matcher.real_quick_ratio() > cutoff and matcher.quick_ratio() > cutoff:
+            ratio = matcher.ratio()
+            if ratio > cutoff:
+                scored.append((ratio, k))
+
+    scored.sort(key=lambda pair: pair[0], reverse=True)
+    return [k for _, k in scored]
 
 
 T_Callable = typing.TypeVar('T_Callable', bound=typing.Callable[..., typing.Any])
 
 
+@functools.lru_cache(maxsize=64)
+def _indent_re(indent: str):
+    """
+    Compiled pattern matching ``indent`` at the start of a line -- cached since decorator
+    application at import time keeps re-indenting docstrings with the same few indents
+    """
+    return re.compile(f"^{re.escape(indent)}", re.MULTILINE)
+
+
 class append_doc:
     """
     Helper to append information to docstrings of callables
@@ -86,16 +127,26 @@ class append_doc:
             indent.startswith(info_indents[0]) for indent in info_indents
         ), f"Inconsistent indents for {info}"
 
-        replace = functools.partial(re.compile(f"^{info_indents[0]}", re.MULTILINE).sub, orig_indents[0])
+        replace = functools.partial(_indent_re(info_indents[0]).sub, orig_indents[0])
         self.cb.__doc__ = doc + '\n'.join(map(replace, info.split('\n')))
 
 
 def document_decorator(decorator):
     def inner(decorated):
-        # if not os.environ.get('SPHINX_DOC_BUILDING'):
-        #     return decorated
+        if not os.environ.get('SPHINX_DOC_BUILDING'):
+            # the enriched docstrings are only needed for the documentation build
+            # (docs/source/conf.py sets the variable) -- inspect.signature is too
+            # expensive to run for every decorator application at import time
+            return decorated
+
         is_async = asyncio.iscoroutinefunction(decorated)
-        sig = inspect.signature(decorated)
+        sig = getattr(decorated, '__signature__', None)
+        if sig is None:
+            sig = inspect.signature(decorated)
+            try:
+                decorated.__signature__ = sig
+            except (AttributeError, TypeError):
+                pass
 
         if is_async:
             ret_type = '[' + sig.return_annotation.strip("'") + ']' if sig.return_annotation != sig.empty else ''
@@ -158,7 +209,8 @@ class hook(typing.Generic[T_Callable]):
     Notes:
 
         *   Decorators need not to be unique, registering the same decorator multiple times will apply it multiple times.
-        *   Decorators are applied at the first call to the :class:`hook`, i.e. the first call could take longer.
+        *   Decorators are applied when they are registered, calls to the :class:`hook` use the composed callable
+            directly.
         *   :attr:`hook.func` is the unmodified callable passed during initialization. If necessary one can clear the
             cached 'applied' version of the callable with :meth:`hook.cache_clear`
 
@@ -209,9 +261,20 @@ class hook(typing.Generic[T_Callable]):
         Reference to unmodified callable
         """
         self._global_decorators = list(decorators or ())
-        self._instance_decorators: typing.MutableMapping[int, typing.List] = {}
-        self._instance_callables: typing.MutableMapping[int, typing.Callable] = {}
-        self._applied = None
+        self._global_decorator_set = set(self._global_decorators)
+        self._instance_attr = f"_ubii_hook_{id(self):x}"
+        self._attr_name = None
+        self._special_kw = {f"_{type(self).__name__}__first_argument_is_instance": True}
+        """
+        Per instance decorator state lives in ``instance.__dict__[self._instance_attr]`` as a
+        ``[decorators, composed]`` pair -- garbage collection of the instance reclaims it without
+        the finalizer and id-keyed bookkeeping this used to need
+        """
+        # apply constructor-passed decorators right away -- plain hooks degrade to a
+        # direct call of the wrapped callable, so __call__ never needs to check whether
+        # the composition still has to happen
+        self._applied = compose(*self._global_decorators)(func) if self._global_decorators else func
+        self._has_instance_state = False
         functools.wraps(func)(self)
 
     def decorators(self, instance: object | None = None):
@@ -221,7 +284,15 @@ class hook(typing.Generic[T_Callable]):
         Args:
             instance: return decorators for this specific instance -- `optional`
         """
-        return self._global_decorators + (self._instance_decorators.get(id(instance), []) if instance else [])
+        state = getattr(instance, self._instance_attr, None) if instance is not None else None
+        return self._global_decorators + (state[0] if state else [])
+
+    def decorator_set(self) -> typing.Set:
+        """
+        Set over the globally registered decorators for :math:`O(1)` membership tests --
+        the ordered list from :meth:`.decorators` stays authoritative for application order
+        """
+        return self._global_decorator_set
 
     def register_decorator(self, decorator, instance: object | None = None) -> None:
         """
@@ -232,44 +303,57 @@ class hook(typing.Generic[T_Callable]):
             instance: only register decorator for this specific instance -- `optional`
         """
         if instance is not None:
-            weakref.finalize(instance, lambda key: self._instance_decorators.pop(key, None), id(instance))
-            self._instance_decorators.setdefault(id(instance), []).append(decorator)
-            self._instance_callables.pop(id(instance), None)
+            state = instance.__dict__.get(self._instance_attr)
+            if state is None:
+                state = instance.__dict__[self._instance_attr] = [[], None]
+
+            state[0].append(decorator)
+            state[1] = None  # compose again at next call
+            self._has_instance_state = True
         else:
             self._global_decorators.append(decorator)
+            self._global_decorator_set.add(decorator)
             self.cache_clear()
 
     def cache_clear(self):
         """
-        Apply decorators again at next access
+        Apply the registered decorators again, immediately -- calls never pay for composition
         """
-        self._applied = None
+        self._applied = compose(*self._global_decorators)(self.func) if self._global_decorators else self.func
 
     def __call__(self, *args, __first_argument_is_instance=False, **kwargs):
-        if self._applied is None:
-            self._applied = compose(*self._global_decorators)(self.func) if self._global_decorators else self.func
+        func = self._applied
 
-        if args and __first_argument_is_instance:
+        if args and __first_argument_is_instance and self._has_instance_state:
             instance = args[0]
-            if id(instance) not in self._instance_callables and id(instance) in self._instance_decorators:
-                self._instance_callables[id(instance)] = compose(*self._instance_decorators[id(instance)])(self)
-            else:
-                self._instance_callables[id(instance)] = self
+            state = getattr(instance, self._instance_attr, None)
+            if state is not None:
+                instance_func = state[1]
+                if instance_func is None:
+                    instance_func = state[1] = compose(*state[0])(self) if state[0] else self
 
-            func = self._instance_callables[id(instance)]
-        else:
-            func = self._applied
+                func = instance_func
 
         return func(*args, **kwargs)
 
+    def __set_name__(self, owner, name):
+        self._attr_name = name
+
     def __get__(self, instance=None, owner=None):
         if instance is None:
             return self
 
-        # we need to mangle the name
-        special_args = {f"_{type(self).__name__}__first_argument_is_instance": True}
+        # the mangled-name kwargs are precomputed in __init__
+        bound = functools.partial(self, instance, **self._special_kw)
+        if self._attr_name is not None:
+            try:
+                # non-data descriptor: the cached partial shadows this __get__ for
+                # later lookups on the same instance
+                instance.__dict__[self._attr_name] = bound
+            except (AttributeError, TypeError):
+                pass
 
-        return functools.partial(self, instance, **special_args)
+        return bound
 
 
 class registry(typing.Generic[S, T]):
@@ -380,19 +464,37 @@ def exc_handler_decorator(handler: typing.Callable[[ExcInfo], typing.Awaitable[N
 
     """
 
+    # most handlers are plain callables returning None (like the print based handler
+    # above), so decide once whether the handler result definitely needs an await --
+    # sync handlers returning an awaitable still get it through the fallback check,
+    # the exception path is cold anyway
+    handler_is_coro = asyncio.iscoroutinefunction(_unwrap_partial(handler))
+
     def decorator(fun):
-        @functools.wraps(fun)
-        async def _inner(*args, **kwargs):
-            try:
-                result = fun(*args, **kwargs)
-                if asyncio.isfuture(result) or asyncio.iscoroutine(result):
-                    result = await result
-                return result
-            except:  # noqa
-                exception_info = sys.exc_info()
-                result = handler(*exception_info)
-                if asyncio.isfuture(result) or asyncio.iscoroutine(result):
-                    await result
+        # specialize at decoration time -- for coroutine functions the awaitable check per
+        # call is unnecessary, and `except BaseException as e` is cheaper than a bare
+        # except plus sys.exc_info() while catching exactly the same exceptions
+        if asyncio.iscoroutinefunction(fun):
+            @functools.wraps(fun)
+            async def _inner(*args, **kwargs):
+                try:
+                    return await fun(*args, **kwargs)
+                except BaseException as e:  # noqa
+                    result = handler(type(e), e, e.__traceback__)
+                    if handler_is_coro or asyncio.isfuture(result) or asyncio.iscoroutine(result):
+                        await result
+        else:
+            @functools.wraps(fun)
+            async def _inner(*args, **kwargs):
+                try:
+                    result = fun(*args, **kwargs)
+                    if asyncio.isfuture(result) or asyncio.iscoroutine(result):
+                        result = await result
+                    return result
+                except BaseException as e:  # noqa
+                    result = handler(type(e), e, e.__traceback__)
+                    if handler_is_coro or asyncio.isfuture(result) or asyncio.iscoroutine(result):
+                        await result
 
         return _inner
 
@@ -413,7 +515,9 @@ def log_call(logger: logging.Logger | None = None):
 
         @functools.wraps(fun)
         def __inner(*args):
-            log.debug(f"called {fun}")
+            # don't pay for the f-string when debug logging is off
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("called %s", fun)
             return fun(*args)
 
         return __inner
@@ -436,14 +540,18 @@ class AbstractAnnotations:
         names.update(self.names)
         setattr(cls, self.attr_name, names)
 
+        if not names:
+            return cls
+
         original_new = cls.__new__
 
-        wrapped = self.wrap_once(original_new)  # might return original_new if already decorated
+        # might return original_new if already decorated
+        wrapped = self.wrap_once(original_new, names)
         setattr(cls, original_new.__name__, wrapped)
 
         return cls
 
-    def wrap_once(self, original_new):
+    def wrap_once(self, original_new, required):
         wrap_markers = getattr(original_new, 'markers', set())
         if self.wrap_marker in wrap_markers:
             return original_new
@@ -453,8 +561,11 @@ class AbstractAnnotations:
             instance = original_new(cls, *args, **kwargs)
 
             # is instance can be created type(instance) can't have abstract methods, so
-            # instance also has to have all required attributes
-            missing = [name for name in getattr(cls, self.attr_name, []) if not hasattr(cls, name)]
+            # instance also has to have all required attributes. ``required`` is the
+            # set shared through the class attribute, so names added when subclasses
+            # are decorated later are still checked -- but without the attribute
+            # lookup per instantiation
+            missing = [name for name in required if not hasattr(cls, name)]
             if missing:
                 raise TypeError(
                     f"Can't create {cls} instance with missing class attribute[s] {', '.join(map(repr, missing))}")
@@ -491,7 +602,13 @@ class ProtoRegistry(ub.ProtoMeta, RegistryMeta):
         Serialize all registered Protocol Buffer Wrapper objects and pickle the results to ``path``
         """
         with open(path, 'wb') as file:
-            pickle.dump(cls._serialize_all(), file)
+            # stream a count followed by (key, serialized) pairs instead of materializing
+            # the dict of all serialized messages first
+            pickler = pickle.Pickler(file, protocol=pickle.HIGHEST_PROTOCOL)
+            registry = cls.registry
+            pickler.dump(len(registry))
+            for key, obj in registry.items():
+                pickler.dump((key, cls.serialize(obj)))
 
     def update_specs(cls, path) -> None:
         """
@@ -502,17 +619,77 @@ class ProtoRegistry(ub.ProtoMeta, RegistryMeta):
             path: load binary pickle file from here
 
         """
+        registry = cls.registry
+        updated = set()
+
         with open(path, 'rb') as file:
-            loaded = pickle.load(file)
+            unpickler = pickle.Unpickler(file)
+            loaded = unpickler.load()
+            if isinstance(loaded, dict):
+                # file written by save_specs before the streaming format
+                pairs = iter(loaded.items())
+            else:
+                pairs = (unpickler.load() for _ in range(loaded))
 
-        specs = cls._deserialize_all(loaded)
-        for key, item in cls.registry.items():
-            spec = specs.get(key)
-            if not spec:
-                warnings.warn(f"No {cls} instance for key {key} registered, can't update")
-                continue
+            # deserialize on demand while streaming the pairs -- no intermediate
+            # dict of all (de)serialized specs
+            for key, raw in pairs:
+                item = registry.get(key)
+                if item is None or not raw:
+                    continue
 
-            cls.copy_from(item, spec)
+                cls.copy_from(item, cls.deserialize(raw))
+                updated.add(key)
+
+        for key in registry.keys() - updated:
+            warnings.warn(f"No {cls} instance for key {key} registered, can't update")
+
+
+def _codegen_pipeline(funcs: typing.Tuple[typing.Callable, ...], nested: bool) -> typing.Callable:
+    """
+    Generate one function calling every callable in ``funcs`` -- as nested composition when
+    ``nested`` is set, otherwise as a statement chain passing the same arguments to each.
+    The generated code dispatches through a single python frame with plain name loads, the
+    same tactic :func:`collections.namedtuple` uses for its generated methods
+
+    Args:
+        funcs: callables to combine
+        nested: compose (``f1(f0(*args))``) instead of chaining (``f0(*args); f1(*args)``)
+
+    Returns:
+        the generated function, closing over ``funcs`` via its globals
+    """
+    names = {f"_f{index}": func for index, func in enumerate(funcs)}
+    if nested:
+        call = "_f0(*args)"
+        for index in range(1, len(funcs)):
+            call = f"_f{index}({call})"
+        src = f"def _generated(*args):\n    return {call}\n"
+    else:
+        body = "\n    ".join(f"_f{index}(*args)" for index in range(len(funcs))) or "pass"
+        src = f"def _generated(*args):\n    {body}\n"
+
+    exec(src, names)  # noqa -- only interpolates enumerated names
+    return names['_generated']
+
+
+def _codegen_async_pipeline(funcs: typing.Tuple[typing.Callable, ...]) -> typing.Callable:
+    """
+    Like :func:`_codegen_pipeline` with ``nested`` set, but awaiting every step -- one
+    generated coroutine function with sequential awaits instead of a nested chain of
+    wrapper frames that each suspend and resume
+
+    Args:
+        funcs: coroutine functions to combine
+
+    Returns:
+        the generated coroutine function, closing over ``funcs`` via its globals
+    """
+    names = {f"_f{index}": func for index, func in enumerate(funcs)}
+    steps = "\n    ".join(f"value = await _f{index}(value)" for index in range(1, len(funcs)))
+    src = f"async def _generated(*args):\n    value = await _f0(*args)\n    {steps}\n    return value\n"
+    exec(src, names)  # noqa -- only interpolates enumerated names
+    return names['_generated']
 
 
 class function_chain:
@@ -542,10 +719,10 @@ class function_chain:
         """
         Tuple of functions that need to be called
         """
+        self._chained = _codegen_pipeline(funcs, nested=False)
 
     def __call__(self, *args):
-        for f in self.funcs:
-            f(*args)
+        self._chained(*args)
 
     def __get__(self, instance=None, owner=None):
         if instance is None:
@@ -592,7 +769,7 @@ class compose:
         """
         Tuple of original callables
         """
-        self._reduced = functools.reduce(lambda g, f: lambda *a: f(g(*a)), funcs)
+        self._reduced = _codegen_pipeline(funcs, nested=True)
 
     def __call__(self, *args):
         return self._reduced(*args)
@@ -639,11 +816,19 @@ class make_dict(typing.Generic[S, T]):
         self._filter = filter_none
 
     def __call__(self, iterable: typing.Iterable) -> typing.Dict[S, T]:
-        return {
-            self._key(item): self._value(item)
-            for item in iterable
-            if not self._filter or self._value(item)
-        }
+        key, value = self._key, self._value
+        if not self._filter:
+            return {key(item): value(item) for item in iterable}
+
+        # evaluate the value function once per item, the old comprehension called it
+        # twice on the filtered path
+        result = {}
+        for item in iterable:
+            val = value(item)
+            if val:
+                result[key(item)] = val
+
+        return result
 
 
 class async_compose:
@@ -700,13 +885,32 @@ class async_compose:
             return f"{self.g!r}({self.f!r})(...)"
 
     def __init__(self, *fns):
-        self._reduced = functools.reduce(self.composed, fns)
+        self.fns = fns
+        """
+        Tuple of original coroutine functions
+        """
+        if len(fns) == 2:
+            # the common case (see the docstring example) -- one :class:`composed` wrapper
+            # is already flat, no need to reduce
+            self._reduced = self.composed(*fns)
+        elif len(fns) > 2:
+            # for longer pipelines a single generated frame with sequential awaits beats
+            # the nested chain of :class:`composed` wrappers, each an extra suspension point
+            self._reduced = _codegen_async_pipeline(fns)
+        else:
+            self._reduced = functools.reduce(self.composed, fns)
 
     def __call__(self, *args):
         return self._reduced(*args)
 
     def __repr__(self):
-        return repr(self._reduced)
+        if isinstance(self._reduced, self.composed):
+            return repr(self._reduced)
+
+        call = "..."
+        for fn in self.fns:
+            call = f"{fn!r}({call})"
+        return call
 
 
 class enrich(typing.Callable[..., 'enrich.result']):
@@ -765,7 +969,7 @@ class enrich(typing.Callable[..., 'enrich.result']):
             func: Simple callable or coroutine function. Result will be available as :attr:`~.result.value` field
         """
         assert callable(func), f"{func} needs to be a callable"
-        self._reduced: typing.Union[async_compose, compose]
+        self._reduced: typing.Callable[..., typing.Union['enrich.result', typing.Awaitable['enrich.result']]]
 
         # func opjects can be kinda complex, so to choose the right kind of "compose" we need to find
         # out what actually is happening
@@ -774,16 +978,17 @@ class enrich(typing.Callable[..., 'enrich.result']):
         base = _unwrap_partial(func) if isinstance(func, functools.partial) else func
         base = base.__func__ if inspect.ismethod(base) else base
 
+        # attaching the meta information is a one-liner, inline it in a single closure
+        # instead of building a compose / async_compose object -- default arguments make
+        # every name a fast local load and the call costs one frame instead of two
         if asyncio.iscoroutinefunction(base):
-            async def attach(value):
-                return self.result(value=value, meta=meta)
-
-            self._reduced = async_compose(func, attach)
+            async def _reduced(*args, _result=self.result, _meta=meta, _func=func):
+                return _result(value=await _func(*args), meta=_meta)
         else:
-            def attach(value):
-                return self.result(value=value, meta=meta)
+            def _reduced(*args, _result=self.result, _meta=meta, _func=func):
+                return _result(value=_func(*args), meta=_meta)
 
-            self._reduced = compose(func, attach)
+        self._reduced = _reduced
 
     def __call__(self, *args):
         return self._reduced(*args)
@@ -833,10 +1038,13 @@ class dunder:
             a class decorator
         """
 
+        # the attribute part of the format string only depends on the fixed attrs,
+        # build it once at decoration time
+        template = '[' + ', '.join(f"{attr}={{!r}}" for attr in attrs) + ']'
+
         def __repr__(instance):
-            info = {attr: getattr(instance, attr, None) for attr in attrs}
             return (f"<{instance.__class__.__module__}.{instance.__class__.__name__} "
-                    f"[{', '.join('{}={!r}'.format(k, v) for k, v in info.items())}]>")
+                    + template.format(*(getattr(instance, attr, None) for attr in attrs)) + ">")
 
         def decorator(kls):
             kls.__repr__ = functools.wraps(kls.__repr__)(__repr__)
@@ -866,8 +1074,10 @@ class dunder:
             a class decorator
         """
 
+        sorted_attrs = tuple(sorted(attrs))  # fixed at decoration time, don't sort per hash call
+
         def __hash__(instance):
-            return hash((instance.__class__,) + tuple(map(lambda attr: getattr(instance, attr, None), sorted(attrs))))
+            return hash((instance.__class__, *(getattr(instance, attr, None) for attr in sorted_attrs)))
 
         def decorator(kls):
             kls.__hash__ = functools.wraps(kls.__hash__)(__hash__)
@@ -20,11 +20,15 @@ import warnings
 import aiohttp
 import ubii.proto
 
+try:
+    import orjson
+except ImportError:  # optional dependency, stdlib json is used instead
+    orjson = None
+
 from ubii.framework import (
     services,
     topics,
     util,
-    debug
 )
 
 local_ip = socket.gethostbyname(socket.gethostname())
@@ -52,6 +56,7 @@ class AIOHttpConnection:
         """
         self._session_is_set = asyncio.Event()
         self._session = None
+        self._headers_cache: typing.Tuple[typing.Tuple[bool, str], typing.Dict[str, str]] | None = None
         self.url: str = url
         """
         field to access url
@@ -87,9 +92,18 @@ class AIOHttpConnection:
             {'origin': 'http://10.0.0.1:8080'}
 
         """
+        # every request reads this property -- rebuild the dict only when the scheme or
+        # host ip changed (aiohttp copies passed headers, it never mutates them)
+        key = (self.https, self.host_ip)
+        cached = self._headers_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         localhost_prefix = '127.0.0.'  # actually check for 127.0.0/8 some time
         host = 'localhost' if self.host_ip.startswith(localhost_prefix) else self.host_ip
-        return {'origin': f"http{'s' if self.https else ''}://{host}:8080"}
+        headers = {'origin': f"http{'s' if self.https else ''}://{host}:8080"}
+        self._headers_cache = (key, headers)
+        return headers
 
     @property
     def session(self) -> aiohttp.ClientSession:
@@ -247,23 +261,25 @@ class AIOHttpWebsocketConnection(AIOHttpConnection, topics.DataConnection):
         async for message in self.ws:
             if message.type == aiohttp.WSMsgType.ERROR:
                 self.log_socket_in.error(message.data)
-                if debug():
+                if util.__DEBUG__:  # plain attribute read, this check runs in the receive loop
                     raise message.data
 
             elif message.type == aiohttp.WSMsgType.TEXT:
                 if message.data == "PING":
                     await self.ws.send_str('PONG')
-                    self.log_socket_out.log(logging.DEBUG - 5, f"Sending 'PONG'")
+                    self.log_socket_out.log(logging.DEBUG - 5, "Sending 'PONG'")
 
-                self.log_socket_in.log(logging.DEBUG - 5, f"Received {message.data}")
+                self.log_socket_in.log(logging.DEBUG - 5, "Received %s", message.data)
             elif message.type == aiohttp.WSMsgType.BINARY:
                 data = ubii.proto.TopicData.deserialize(message.data)
-                self.log_socket_in.debug(f"Received {data}")
+                # %s-style formatting defers the expensive proto message __str__ until a
+                # handler actually wants the record -- keep it that way in this loop
+                self.log_socket_in.debug("Received %s", data)
                 yield data
             else:
                 self.log_socket_in.warning(f"Unknown message Type for message: {message}")
 
-        log.info(f"Closing Websocket connection")
+        log.info("Closing Websocket connection")
         del self.ws
 
     @property
@@ -292,7 +308,7 @@ class AIOHttpWebsocketConnection(AIOHttpConnection, topics.DataConnection):
         self._ws = value
         self.events.disconnected.clear()
         self.events.connected.set()
-        log.info(f"Connected {self}")
+        log.info("Connected %s", self)
 
     @ws.deleter
     def ws(self):
@@ -302,7 +318,7 @@ class AIOHttpWebsocketConnection(AIOHttpConnection, topics.DataConnection):
         self._ws = None
         self.events.connected.clear()
         self.events.disconnected.set()
-        log.info(f"Disconnected {self}")
+        log.info("Disconnected %s", self)
 
     @property
     def client_id(self):
@@ -344,7 +360,7 @@ class AIOHttpWebsocketConnection(AIOHttpConnection, topics.DataConnection):
         """
         await asyncio.wait_for(self.events.connected.wait(), timeout=timeout)
         assert self.ws is not None
-        self.log_socket_out.debug(f"Sending {data}")
+        self.log_socket_out.debug("Sending %s", data)
         await asyncio.wait_for(self.ws.send_bytes(ubii.proto.TopicData.serialize(data)), timeout=timeout)
 
 
@@ -376,8 +392,12 @@ class AIOHttpRestConnection(AIOHttpConnection, services.ServiceConnection):
             :attr:`ubii.proto.ServiceReply.type` -- the oneof group for possible reply fields
         """
         await asyncio.wait_for(self._session_is_set.wait(), timeout=timeout)
-        async with self.session.post(self.url, headers=self.headers, json=request, timeout=timeout) as resp:
-            json = await asyncio.wait_for(resp.text(), timeout=timeout)
+        # aiohttp's own timeout covers the whole request including reading the body,
+        # no need to wrap resp.text() in another wait_for frame -- without an explicit
+        # timeout the session default applies
+        kwargs = {'timeout': aiohttp.ClientTimeout(total=timeout)} if timeout is not None else {}
+        async with self.session.post(self.url, headers=self.headers, json=request, **kwargs) as resp:
+            json = await resp.text()
             return ubii.proto.ServiceReply.from_json(json,
                                                      ignore_unknown_fields=True)  # master node bug requires ignore
 
@@ -391,7 +411,8 @@ def aiohttp_session():
     this function will return a different session, with logging for requests (see :class:`aiohttp.TraceConfig`)
     and a timeout of `1` second compared to `300` seconds for the normal session.
 
-    Both sessions use the :class:`ubii.proto.util.ProtoEncoder` to serialize json, and raise Exceptions when
+    Both sessions use the :class:`ubii.proto.util.ProtoEncoder` to serialize json (through `orjson`
+    when the optional dependency is installed), and raise Exceptions when
     requests fail (see :attr:`aiohttp.ClientSession.raise_for_status`)
 
     >>> from ubii.node import connections
@@ -421,7 +442,7 @@ def aiohttp_session():
         trace_config = aiohttp.TraceConfig()
 
         async def on_request_start(session, context, params):
-            logging.getLogger('aiohttp.client').debug(f'Starting request <{params}>')
+            logging.getLogger('aiohttp.client').debug('Starting request <%s>', params)
 
         trace_config.on_request_start.append(on_request_start)
         trace_configs = [trace_config]
@@ -431,7 +452,21 @@ def aiohttp_session():
         trace_configs = []
 
     from ubii.proto import ProtoEncoder
+
+    if orjson is not None:
+        def json_serialize(obj, _dumps=orjson.dumps, _default=ProtoEncoder().default):
+            # orjson serializes the nested proto dicts considerably faster than the
+            # stdlib encoder -- it produces bytes, aiohttp expects str here
+            return _dumps(obj, default=_default).decode()
+    else:
+        json_serialize = functools.partial(json.dumps, cls=ProtoEncoder)
+
+    # the session is shared between the service and topic connection of a protocol, so
+    # generous keepalive lets repeated service calls reuse the same TCP connection to the
+    # master node instead of paying the handshake per request
+    connector = aiohttp.TCPConnector(limit=64, keepalive_timeout=75)
     return aiohttp.ClientSession(raise_for_status=True,
-                                 json_serialize=functools.partial(json.dumps, cls=ProtoEncoder),
+                                 json_serialize=json_serialize,
                                  trace_configs=trace_configs,
+                                 connector=connector,
                                  timeout=timeout)
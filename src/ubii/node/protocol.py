@@ -24,7 +24,7 @@ from ubii.framework import (
     client,
     constants,
     util,
-    processing, debug,
+    processing,
 )
 from . import connections
 
@@ -57,6 +57,12 @@ class LegacyProtocol(client.AbstractClientProtocol[States]):
     end_state = States.STOPPED
     """
     """
+    publish_batch_size = 128
+    """
+    Records published during the same event loop iteration are coalesced into a single
+    :class:`~ubii.proto.TopicDataList` message -- when this many records are pending, the
+    batch is flushed immediately instead
+    """
 
     __hook_decorators__ = client.AbstractClientProtocol.__hook_decorators__.union([util.log_call()])
     """
@@ -162,7 +168,7 @@ class LegacyProtocol(client.AbstractClientProtocol[States]):
         """
         maybe_suppress = (
             contextlib.suppress(ValueError)
-            if self.state.value == self.end_state and not debug()
+            if self.state.value == self.end_state and not util.__DEBUG__
             else contextlib.nullcontext()
         )
         with maybe_suppress:
@@ -279,6 +285,7 @@ class LegacyProtocol(client.AbstractClientProtocol[States]):
             )
 
         self.client = context.client
+        self._registry_key_cache = None
         assert context.client.protocol == self, (f"{context.client} uses a different protocol "
                                                  f"({context.client.protocol}) instead of {self}")
 
@@ -304,6 +311,7 @@ class LegacyProtocol(client.AbstractClientProtocol[States]):
 
             response = await register_service(client=context.client)
             ubii.proto.Client.copy_from(context.client, response.client)
+            self._registry_key_cache = None
 
             await self.state.set(States.REGISTERED)
 
@@ -392,16 +400,27 @@ class LegacyProtocol(client.AbstractClientProtocol[States]):
         context.client[client.Subscriptions].unsubscribe_regex = context.subscription_manager.unsubscribe_regex
         context.client[client.Subscriptions].unsubscribe_topic = context.subscription_manager.unsubscribe_topic
 
-    def implement_publish(self, context: LegacyProtocol.Context):  # noqa don't care if it could be static
+    def implement_publish(self, context: LegacyProtocol.Context):
         """
         Implement :class:`ubii.node.Publish` behaviour of :attr:`context.client <.Context.client>`
+
+        Records published during the same event loop iteration are coalesced into one
+        :class:`~ubii.proto.TopicData` message, so producers that publish many records in a tight
+        loop pay for one send instead of one per call -- see :attr:`.publish_batch_size`.
+        Prebuilt :class:`~ubii.proto.TopicData` messages bypass the batch and are sent directly.
         """
         assert context.client is not None
 
-        async def publish(*records: typing.Union[ubii.proto.TopicDataRecord, typing.Dict]):
-            assert context.topic_connection is not None
-            if len(records) < 1:
-                raise ValueError(f"Called {publish} without TopicDataRecord message to publish")
+        pending: typing.List[typing.Union[ubii.proto.TopicDataRecord, typing.Dict]] = []
+        flushed: asyncio.Future | None = None
+
+        async def drain():
+            nonlocal pending, flushed
+            if not pending:
+                return
+
+            records, future = pending, flushed
+            pending, flushed = [], None
 
             data = (
                 ubii.proto.TopicData(topic_data_record=records[0])
@@ -409,7 +428,66 @@ class LegacyProtocol(client.AbstractClientProtocol[States]):
                 ubii.proto.TopicData(topic_data_record_list={'elements': records})
             )
 
-            await context.topic_connection.send(data)
+            assert context.topic_connection is not None
+            try:
+                await context.topic_connection.send(data)
+            except Exception as exc:  # noqa -- propagated to every waiting publish call
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                if not future.done():
+                    future.set_result(None)
+
+        async def flush():
+            # yield once, so publish calls from the same loop iteration can accumulate
+            await asyncio.sleep(0)
+            await drain()
+
+        async def publish(*records: typing.Union[ubii.proto.TopicData, ubii.proto.TopicDataRecord, typing.Dict]):
+            nonlocal flushed
+            assert context.topic_connection is not None
+            if len(records) < 1:
+                raise ValueError(f"Called {publish} without TopicDataRecord message to publish")
+
+            if len(records) == 1 and isinstance(records[0], ubii.proto.TopicData):
+                # prebuilt message, send without copying the records into a new TopicData
+                await context.topic_connection.send(records[0])
+                return
+
+            pending.extend(records)
+            if flushed is None:
+                future = flushed = asyncio.get_event_loop().create_future()
+                acquired = False
+                try:
+                    # acquire before spawning, so bursty producers are throttled instead of
+                    # queueing up an unbounded number of flush tasks
+                    await context.client.inflight.acquire()
+                    acquired = True
+                    task = self.task_nursery.create_task(flush())
+                except BaseException as exc:
+                    # don't leave the batch wedged -- without a flush task nobody would
+                    # ever resolve the future concurrent publish calls are waiting on
+                    if acquired:
+                        context.client.inflight.release()
+                    pending.clear()
+                    flushed = None
+                    if isinstance(exc, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(exc)
+                        future.exception()  # mark retrieved, waiters still see it
+                    raise
+
+                task.add_done_callback(lambda _: context.client.inflight.release())
+            else:
+                future = flushed
+
+            if len(pending) >= self.publish_batch_size:
+                await drain()
+
+            # the future is shared by every call in the batch -- shield it, so one
+            # cancelled caller (e.g. a wait_for timeout) can't cancel it for the others
+            await asyncio.shield(future)
 
         context.client[client.Publish].publish = publish
 
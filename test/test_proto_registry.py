@@ -0,0 +1,68 @@
+import pickle
+import warnings
+
+import pytest
+import ubii.proto as ub
+
+from ubii.framework import util
+
+
+@pytest.fixture
+def spec_type():
+    """
+    Fresh registry class per test, so registered instances don't leak between tests
+    """
+    with warnings.catch_warnings():
+        # ProtoMeta rewrites docstrings, the scaffolding class does not need one
+        warnings.filterwarnings('ignore', message='Missing docstring')
+
+        class Spec(ub.Client, metaclass=util.ProtoRegistry):
+            __unique_key_attr__ = 'name'
+
+    return Spec
+
+
+def test_specs_roundtrip(spec_type, tmp_path):
+    path = tmp_path / 'specs.pickle'
+    first = spec_type(name='first', id='1')
+    second = spec_type(name='second', id='2')
+    spec_type.save_specs(path)
+
+    first.id = 'changed'
+    second.id = 'also changed'
+    with warnings.catch_warnings():
+        # every registered instance has its key in the file, nothing may warn
+        warnings.simplefilter('error')
+        spec_type.update_specs(path)
+
+    assert first.id == '1'
+    assert second.id == '2'
+
+
+def test_specs_legacy_dict_format(spec_type, tmp_path):
+    path = tmp_path / 'specs.pickle'
+    spec = spec_type(name='legacy', id='1')
+
+    # files written before the streaming format contain one dict of serialized specs
+    with open(path, 'wb') as file:
+        pickle.dump({key: spec_type.serialize(obj) for key, obj in spec_type.registry.items()}, file)
+
+    spec.id = 'changed'
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        spec_type.update_specs(path)
+
+    assert spec.id == '1'
+
+
+def test_specs_warn_for_unknown_keys(spec_type, tmp_path):
+    path = tmp_path / 'specs.pickle'
+    # keep references, the registry only holds weak ones
+    known = spec_type(name='known', id='1')
+    spec_type.save_specs(path)
+
+    late = spec_type(name='registered later', id='2')
+    with pytest.warns(UserWarning, match="can't update"):
+        spec_type.update_specs(path)
+
+    assert known.id == '1' and late.id == '2'
@@ -9,8 +9,11 @@ from dataclasses import dataclass
 from typing import Callable
 
 import pytest
+import ubii.proto as ub
+from codestare.async_utils.nursery import TaskNursery
+from types import SimpleNamespace
 
-from ubii.framework.client import UbiiClient
+from ubii.framework.client import Publish, UbiiClient
 from ubii.framework.protocol import AbstractProtocol, RunProtocol
 from ubii.node.protocol import LegacyProtocol, States as UbiiStates
 
@@ -169,3 +172,124 @@ async def test_fake_protocol():
     async with client as started_client:
         assert not started_client.implements(BarBehaviour)
         await asyncio.gather(implement_bar(), use_behaviours())
+
+
+class MockTopicConnection:
+    """
+    Records everything sent instead of talking to a master node
+    """
+
+    def __init__(self):
+        self.sent: list[ub.TopicData] = []
+        self.delay = 0
+
+    async def send(self, data: ub.TopicData, timeout=None):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(data)
+
+
+class MockPublishClient:
+    """
+    Just enough of the :class:`UbiiClient` surface for the publish behaviour --
+    the inflight semaphore and access to the :class:`~ubii.framework.client.Publish` behaviour
+    """
+
+    def __init__(self):
+        self.inflight = asyncio.Semaphore(UbiiClient.max_inflight)
+        self._behaviours = {Publish: Publish()}
+
+    def __getitem__(self, kls):
+        return self._behaviours[kls]
+
+
+class MockPublishProtocol:
+    """
+    Borrows the publish implementation from :class:`LegacyProtocol` without the
+    connection setup its constructor performs
+    """
+
+    publish_batch_size = LegacyProtocol.publish_batch_size
+    implement_publish = LegacyProtocol.implement_publish
+
+    def __init__(self, task_nursery):
+        self.task_nursery = task_nursery
+
+
+@pytest.fixture
+async def publish_context():
+    nursery = TaskNursery(name='test_publish')
+    protocol = MockPublishProtocol(nursery)
+    context = SimpleNamespace(client=MockPublishClient(), topic_connection=MockTopicConnection())
+    protocol.implement_publish(context)
+    yield context
+    await nursery.aclose()
+
+
+async def test_publish_coalesces_records(publish_context):
+    publish = publish_context.client[Publish].publish
+    records = [ub.TopicDataRecord(topic='test', int32=n) for n in range(5)]
+    await asyncio.gather(*map(publish, records))
+
+    sent = publish_context.topic_connection.sent
+    assert len(sent) == 1
+    assert [record.int32 for record in sent[0].topic_data_record_list.elements] == list(range(5))
+
+
+async def test_publish_single_record(publish_context):
+    await publish_context.client[Publish].publish(ub.TopicDataRecord(topic='test', string='x'))
+
+    sent = publish_context.topic_connection.sent
+    assert len(sent) == 1
+    assert sent[0].topic_data_record.string == 'x'
+
+
+async def test_publish_cancelled_mid_batch(publish_context):
+    publish = publish_context.client[Publish].publish
+    inflight = publish_context.client.inflight
+
+    # exhaust the semaphore so the publish call blocks before it can spawn a flush task
+    acquired = 0
+    while not inflight.locked():
+        await inflight.acquire()
+        acquired += 1
+
+    task = asyncio.create_task(publish(ub.TopicDataRecord(topic='test', int32=1)))
+    await asyncio.sleep(0)  # let the task block on the semaphore
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    for _ in range(acquired):
+        inflight.release()
+
+    # the batch state was reset, a later publish must not wait on the abandoned future
+    await asyncio.wait_for(publish(ub.TopicDataRecord(topic='test', int32=2)), timeout=1)
+    sent = publish_context.topic_connection.sent
+    assert len(sent) == 1
+    assert sent[0].topic_data_record.int32 == 2
+
+
+async def test_publish_cancelled_while_awaiting_flush(publish_context):
+    publish = publish_context.client[Publish].publish
+    # slow down the send, so the timeout below fires while the flush is in progress
+    publish_context.topic_connection.delay = 0.1
+
+    async def impatient():
+        await asyncio.wait_for(publish(ub.TopicDataRecord(topic='test', int32=1)), timeout=0.01)
+
+    results = await asyncio.gather(
+        impatient(),
+        publish(ub.TopicDataRecord(topic='test', int32=2)),
+        return_exceptions=True,
+    )
+
+    # only the impatient caller times out, the shared batch future stays untouched
+    assert isinstance(results[0], asyncio.TimeoutError)
+    assert results[1] is None
+
+    # the queued records of both callers still went out in one message (wait_for
+    # schedules the wrapped publish as a task, so the arrival order is not fixed)
+    sent = publish_context.topic_connection.sent
+    assert len(sent) == 1
+    assert sorted(record.int32 for record in sent[0].topic_data_record_list.elements) == [1, 2]
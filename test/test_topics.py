@@ -133,6 +133,39 @@ async def test_task_manager(make_connection, container, items):
     assert all(t.cancelled() for t in a.callback_tasks.values())
 
 
+async def test_match_name(container):
+    """
+    The trie backed match_name needs to behave exactly like the linear fnmatch scan it replaces
+    """
+    import fnmatch
+
+    patterns = [
+        '/info/processing_module/start',
+        '/info/*',
+        '*',
+        'A',
+        'A*',
+        '/foo/*/bar',
+        '/tasks/[0-9]',
+    ]
+    for pattern in patterns:
+        container[pattern]  # noqa -- creating the topics indexes the patterns
+
+    names = ['/info/processing_module/start', '/info/x/y', '/info', 'A', 'AB', '/foo/x/y/bar', '/tasks/1', 'B']
+    for name in names:
+        expected = {pattern for pattern in patterns if fnmatch.fnmatch(name=name, pat=pattern)}
+        assert {topic.pattern for topic in container.match_name(name)} == expected
+
+    del container['/info/*']
+    del container['A*']
+    for name in names:
+        expected = {
+            pattern for pattern in patterns
+            if pattern in container and fnmatch.fnmatch(name=name, pat=pattern)
+        }
+        assert {topic.pattern for topic in container.match_name(name)} == expected
+
+
 @pytest.mark.parametrize('items', [15])
 async def test_task_regex_topics(make_connection, container, items):
     all_regex = container['*']